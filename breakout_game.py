@@ -20,7 +20,8 @@ sudo python3 breakout_game.py
 """
 import os
 import sys
-from typing import List, Tuple
+import time
+from typing import Tuple
 
 import numpy as np
 import pygame
@@ -33,31 +34,60 @@ except ImportError as exc:
         "Piomatter library missing. Install with pip and use a Pi 5‑compatible kernel"
     ) from exc
 
+try:
+    from numba import njit
+except ImportError as exc:
+    raise RuntimeError(
+        "Numba missing (used to JIT the frame hot paths). Install with pip install numba"
+    ) from exc
+
 class LEDDisplay:
     """Simple NumPy → Piomatter framebuffer push"""
 
     def __init__(self, w: int, h: int):
         self.w, self.h = w, h
-        self.fb = np.zeros((h, w, 3), dtype=np.uint8)
+        # One 0x00RRGGBB word per pixel, so a pixel write is a single store;
+        # fb is the same memory seen as (h, w, 3) RGB bytes
+        self._fb32 = np.zeros((h, w), dtype=np.uint32)
+        self.fb = self._fb32.view(np.uint8).reshape(h, w, 4)[:, :, 2::-1]
         geom = piomatter.Geometry(width=w, height=h, n_addr_lines=4,
                                   rotation=piomatter.Orientation.Normal)
-        self.matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
+        self.matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888,
                                           pinout=piomatter.Pinout.AdafruitMatrixBonnet,
-                                          framebuffer=self.fb,
+                                          framebuffer=self._fb32,
                                           geometry=geom)
+        self._last_hash = None  # hash of the last frame pushed to the panel
     def clear(self):
-        self.fb.fill(0)
+        self._fb32.fill(0)
 
-    def set(self, x: int, y: int, rgb: Tuple[int, int, int]):
+    def set(self, x: int, y: int, color: int):
         if 0 <= x < self.w and 0 <= y < self.h:
-            self.fb[y, x] = rgb
+            self._fb32[y, x] = color
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: int):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.w, x + w), min(self.h, y + h)
+        if x1 > x0 and y1 > y0:
+            blit_rect(self._fb32, int(x0), int(y0), int(x1), int(y1), int(color))
+
+    def clear_rect(self, x: int, y: int, w: int, h: int):
+        self.fill_rect(x, y, w, h, 0)
 
     def show(self):
+        frame_hash = hash(self._fb32.tobytes())
+        if frame_hash == self._last_hash:
+            return  # unchanged since the last push; skip the DMA
         try:
             self.matrix.show()
+            self._last_hash = frame_hash
         except TimeoutError:
             pass  # occasionally Piomatter times out; skip frame
 
+def rgb32(rgb: Tuple[int, int, int]) -> int:
+    """Pack an (r, g, b) colour into the framebuffer's 0x00RRGGBB word."""
+    r, g, b = rgb
+    return (r << 16) | (g << 8) | b
+
 # ─────────────────────────── Gameplay Constants ─────────────────────────────
 W, H = 64, 32
 FPS = 15                    # ↓ from 30 (v1.3) and 60 (original)
@@ -67,13 +97,62 @@ BALL_SPEED = 2               # already minimal integer speed
 BRICK_ROWS, BRICK_COLS = 4, 8
 BRICK_W, BRICK_H = W // BRICK_COLS, 3
 LIVES_START = 3
+# Only these reach the Python event queue; SDL drops everything else
+EVENT_TYPES = (pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION, pygame.JOYHATMOTION)
 
-COL_PADDLE = (255, 255, 255)
-COL_BALL   = (255,   0,   0)
-BRICK_COLORS = [
+COL_PADDLE = rgb32((255, 255, 255))
+COL_BALL   = rgb32((255,   0,   0))
+BRICK_COLORS = [rgb32(c) for c in [
     (255,  80,  80), (255, 165,   0), (255, 255,   0), (  0, 255,   0),
     (  0, 180, 255), (  0,   0, 255), (170,   0, 255), (255,   0, 255),
-]
+]]
+
+# ───────────────────────────── JIT Kernels ──────────────────────────────────
+@njit(cache=True, fastmath=True)
+def blit_rect(fb, x0, y0, x1, y1, color):
+    for y in range(y0, y1):
+        for x in range(x0, x1):
+            fb[y, x] = color
+
+@njit(cache=True, fastmath=True)
+def ball_step(state, brick_xy, brick_alive, paddle_x, paddle_y):
+    """Advance a released ball one tick.
+
+    ``state`` is ``[x, y, dx, dy]`` and is updated in place; a destroyed
+    brick is cleared in ``brick_alive``.  Returns the score gained.
+    """
+    x = state[0] + state[2]
+    y = state[1] + state[3]
+    dx, dy = state[2], state[3]
+    if x <= 0 or x >= W - BALL_SZ:
+        dx = -dx
+    if y <= 0:
+        dy = -dy
+    if (paddle_y <= y + BALL_SZ <= paddle_y + PADDLE_H and
+            paddle_x <= x <= paddle_x + PADDLE_W and dy > 0):
+        dy = -float(BALL_SPEED)
+        offset = ((x - paddle_x) / PADDLE_W) - 0.5
+        new_dx = float(int(offset * 4))
+        if new_dx == 0:
+            new_dx = 1.0 if dx >= 0 else -1.0
+        dx = new_dx
+    score = 0
+    for i in range(brick_xy.shape[0]):
+        if not brick_alive[i]:
+            continue
+        bx, by = brick_xy[i, 0], brick_xy[i, 1]
+        if bx <= x <= bx + BRICK_W - 1 and by <= y <= by + BRICK_H - 1:
+            brick_alive[i] = False
+            dy = -dy
+            score += 1
+            break
+    state[0], state[1], state[2], state[3] = x, y, dx, dy
+    return score
+
+def warm_jit():
+    """Compile the kernels up front so the first frame isn't JIT-stalled."""
+    blit_rect(np.zeros((1, 1), dtype=np.uint32), 0, 0, 1, 1, 0)
+    ball_step(np.zeros(4), np.zeros((1, 2), dtype=np.int16), np.zeros(1, dtype=bool), 0, 0)
 
 # ───────────────────────────── Game Objects ─────────────────────────────────
 class Paddle:
@@ -89,6 +168,7 @@ class Paddle:
 class Ball:
     def __init__(self, paddle: "Paddle"):
         self.sz = BALL_SZ
+        self.state = np.zeros(4)  # scratch [x, y, dx, dy] for ball_step
         self.reset(paddle)
 
     def reset(self, paddle: "Paddle"):
@@ -100,70 +180,59 @@ class Ball:
     def release(self):
         self.stuck = False
 
-    def update(self, paddle: "Paddle", bricks: List[Tuple[int, int]]):
+    def update(self, paddle: "Paddle", brick_xy: np.ndarray, brick_alive: np.ndarray):
         if self.stuck:
             self.x = paddle.x + paddle.w // 2
             self.y = paddle.y - self.sz - 1
             return 0
-        self.x += self.dx
-        self.y += self.dy
-        score = 0
-        if self.x <= 0 or self.x >= W - self.sz:
-            self.dx *= -1
-        if self.y <= 0:
-            self.dy *= -1
-        if (
-            paddle.y <= self.y + self.sz <= paddle.y + paddle.h and
-            paddle.x <= self.x <= paddle.x + paddle.w and self.dy > 0
-        ):
-            self.dy = -BALL_SPEED
-            offset = ((self.x - paddle.x) / paddle.w) - 0.5
-            self.dx = int(offset * 4) or (1 if self.dx >= 0 else -1)
-        for bx, by in bricks:
-            if bx <= self.x <= bx + BRICK_W - 1 and by <= self.y <= by + BRICK_H - 1:
-                bricks.remove((bx, by))
-                self.dy *= -1
-                score += 1
-                break
+        st = self.state
+        st[0], st[1], st[2], st[3] = self.x, self.y, self.dx, self.dy
+        score = ball_step(st, brick_xy, brick_alive, paddle.x, paddle.y)
+        self.x, self.y, self.dx, self.dy = st.tolist()
         return score
 
-    def pixels(self):
-        """Return integer pixel coordinates the ball occupies."""
-        ix = int(round(self.x))
-        iy = int(round(self.y))
-        for px in range(ix, ix + self.sz):
-            for py in range(iy, iy + self.sz):
-                yield px, py
-
 # ─────────────────────────────── Game Loop ──────────────────────────────────
 class Breakout:
     def __init__(self, display: LEDDisplay):
         self.dsp = display
         os.environ["SDL_VIDEODRIVER"] = "dummy"
         pygame.init(); pygame.joystick.init()
+        pygame.event.set_blocked(None); pygame.event.set_allowed(EVENT_TYPES)
         if pygame.joystick.get_count() == 0:
             print("No USB gamepad detected – exiting")
             sys.exit(1)
         self.pad = pygame.joystick.Joystick(0); self.pad.init()
+        warm_jit()
+        # What the framebuffer currently shows, so each frame only redraws changes
+        self.brick_drawn = np.zeros(BRICK_ROWS * BRICK_COLS, dtype=bool)
+        self.prev_ball_rect = self.prev_paddle_rect = None
         self.reset()
 
     def reset(self):
         self.score, self.lives = 0, LIVES_START
         self.paddle = Paddle()
         self.ball = Ball(self.paddle)
-        self.bricks = [(c*BRICK_W, 2 + r*BRICK_H) for r in range(BRICK_ROWS) for c in range(BRICK_COLS)]
+        # Bricks as parallel arrays: fixed positions plus a live mask
+        self.brick_xy = np.array([(c*BRICK_W, 2 + r*BRICK_H) for r in range(BRICK_ROWS)
+                                  for c in range(BRICK_COLS)], dtype=np.int16)
+        self.brick_alive = np.ones(len(self.brick_xy), dtype=bool)
+        self.brick_rgb = np.array([BRICK_COLORS[(i % BRICK_COLS + i // BRICK_COLS) % len(BRICK_COLORS)]
+                                   for i in range(len(self.brick_xy))], dtype=np.uint32)
 
-    @staticmethod
-    def brick_color(bx, by):
-        return BRICK_COLORS[(bx//BRICK_W + by//BRICK_H) % len(BRICK_COLORS)]
+    def bricks_under(self, x: int, y: int, w: int, h: int) -> np.ndarray:
+        """Mask of the bricks overlapping the given rectangle."""
+        bx, by = self.brick_xy[:, 0], self.brick_xy[:, 1]
+        return (bx < x + w) & (x < bx + BRICK_W) & (by < y + h) & (y < by + BRICK_H)
 
     def run(self):
-        clock = pygame.time.Clock()
+        # Fixed-deadline pacing: sleep only for whatever is left of the frame
+        period = 1.0 / FPS
+        next_t = time.monotonic()
         running = True
         while running:
             # Input
             self.paddle.v = 0.0
-            for e in pygame.event.get():
+            for e in pygame.event.get(EVENT_TYPES):
                 if e.type == pygame.JOYBUTTONDOWN and e.button in (7, 8, 9):
                     running = False
                 elif e.type == pygame.JOYBUTTONDOWN and e.button == 0 and self.ball.stuck:
@@ -177,34 +246,50 @@ class Breakout:
 
             # Update
             self.paddle.update()
-            self.score += self.ball.update(self.paddle, self.bricks)
+            self.score += self.ball.update(self.paddle, self.brick_xy, self.brick_alive)
             if self.ball.y >= H:
                 self.lives -= 1
                 if self.lives == 0:
                     self.reset()
                 else:
                     self.ball.reset(self.paddle)
-            if not self.bricks:
-                self.bricks = [(c*BRICK_W, 2 + r*BRICK_H) for r in range(BRICK_ROWS) for c in range(BRICK_COLS)]
+            if not self.brick_alive.any():
+                self.brick_alive[:] = True
                 self.ball.dx *= 1.1; self.ball.dy *= 1.1
 
-            # Draw
-            d = self.dsp; d.clear()
-            for bx, by in self.bricks:
-                col = self.brick_color(bx, by)
-                for x in range(bx, bx + BRICK_W):
-                    for y in range(by, by + BRICK_H):
-                        d.set(x, y, col)
+            # Draw (dirty rectangles only: erase last frame's movers, redraw changes)
+            d = self.dsp
+            for rect in (self.prev_ball_rect, self.prev_paddle_rect):
+                if rect:
+                    d.clear_rect(*rect)
+            # Bricks: erase destroyed ones, paint new ones and repaint any the
+            # ball's old position was covering
+            gone = self.brick_drawn & ~self.brick_alive
+            fresh = self.brick_alive & ~self.brick_drawn
+            if self.prev_ball_rect:
+                fresh |= self.brick_alive & self.bricks_under(*self.prev_ball_rect)
+            for i in np.flatnonzero(gone):
+                bx, by = self.brick_xy[i]
+                d.clear_rect(bx, by, BRICK_W, BRICK_H)
+            for i in np.flatnonzero(fresh):
+                bx, by = self.brick_xy[i]
+                d.fill_rect(bx, by, BRICK_W, BRICK_H, self.brick_rgb[i])
+            self.brick_drawn[:] = self.brick_alive
             # Paddle
-            for x in range(self.paddle.x, self.paddle.x + self.paddle.w):
-                for y in range(self.paddle.y, self.paddle.y + self.paddle.h):
-                    d.set(x, y, COL_PADDLE)
-            # Ball
-            for px, py in self.ball.pixels():
-                d.set(px, py, COL_BALL)
+            paddle_rect = (self.paddle.x, self.paddle.y, self.paddle.w, self.paddle.h)
+            d.fill_rect(*paddle_rect, COL_PADDLE)
+            # Ball (x/y go fractional once a cleared level speeds it up by 1.1x)
+            ball_rect = (int(round(self.ball.x)), int(round(self.ball.y)), self.ball.sz, self.ball.sz)
+            d.fill_rect(*ball_rect, COL_BALL)
+            self.prev_paddle_rect, self.prev_ball_rect = paddle_rect, ball_rect
             # Push frame to LEDs and regulate FPS
             d.show()
-            clock.tick(FPS)
+            next_t += period
+            slack = next_t - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            else:
+                next_t = time.monotonic()  # running late: don't try to catch up
 
 def main():
     Breakout(LEDDisplay(W, H)).run()
@@ -1,20 +1,42 @@
 # cam_stream.py
+import io
+from threading import Condition
+
 from flask import Flask, Response
 from picamera2 import Picamera2
-import cv2
+from picamera2.encoders import JpegEncoder
+from picamera2.outputs import FileOutput
+
+JPEG_QUALITY = 75  # lower = fewer bytes per frame, more frames/sec over the wire
+
+
+class StreamingOutput(io.BufferedIOBase):
+    """Holds the latest JPEG written by the encoder and wakes waiting clients."""
+
+    def __init__(self):
+        self.frame = None
+        self.condition = Condition()
+
+    def write(self, buf):
+        with self.condition:
+            self.frame = buf
+            self.condition.notify_all()
+
 
 app = Flask(__name__)
 picam2 = Picamera2()
-picam2.configure(picam2.create_video_configuration(main={"size": (640, 480)}))
+# YUV420 goes straight into the encoder; no RGB->BGR conversion on our side
+picam2.configure(picam2.create_video_configuration(main={"size": (640, 480), "format": "YUV420"}))
 # picam2.set_controls({"AwbMode": 1})  # 1 = incandescent, try others below
-picam2.start()
+output = StreamingOutput()
+picam2.start_recording(JpegEncoder(q=JPEG_QUALITY), FileOutput(output))
 
 def gen():
     while True:
-        frame = picam2.capture_array()
-        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-        _, jpeg = cv2.imencode('.jpg', frame)
-        yield (b'--frame\r\nContent-Type: image/jpeg\r\n\r\n' + jpeg.tobytes() + b'\r\n')
+        with output.condition:
+            output.condition.wait()
+            frame = output.frame
+        yield (b'--frame\r\nContent-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
 
 @app.route('/')
 def stream():
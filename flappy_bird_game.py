@@ -13,7 +13,8 @@ sudo python3 flappy_bird_game.py
 """
 import os
 import random
-from typing import List, Tuple
+import time
+from typing import Tuple
 
 import numpy as np
 import pygame
@@ -23,33 +24,89 @@ try:
 except ImportError as exc:
     raise RuntimeError("Piomatter driver missing; install via pip on Pi 5") from exc
 
+try:
+    from numba import njit
+except ImportError as exc:
+    raise RuntimeError("Numba missing (JITs the blit hot paths); install via pip install numba") from exc
+
 
 class LEDDisplay:
     """NumPy‑backed framebuffer pushed to the panel with Piomatter."""
 
     def __init__(self, w: int, h: int):
         self.w, self.h = w, h
-        self.fb = np.zeros((h, w, 3), dtype=np.uint8)
+        # One 0x00RRGGBB word per pixel, so a pixel write is a single store;
+        # fb is the same memory seen as (h, w, 3) RGB bytes
+        self._fb32 = np.zeros((h, w), dtype=np.uint32)
+        self.fb = self._fb32.view(np.uint8).reshape(h, w, 4)[:, :, 2::-1]
         geom = piomatter.Geometry(width=w, height=h, n_addr_lines=4,
                                   rotation=piomatter.Orientation.Normal)
-        self.matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
+        self.matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888,
                                           pinout=piomatter.Pinout.AdafruitMatrixBonnet,
-                                          framebuffer=self.fb, geometry=geom)
+                                          framebuffer=self._fb32, geometry=geom)
+        self._last_hash = None  # hash of the last frame pushed to the panel
 
     def clear(self):
-        self.fb.fill(0)
+        self._fb32.fill(0)
+
+    def set(self, x: int, y: int, color: int):
+        if (0 <= x < self.w) & (0 <= y < self.h):  # one combined bounds test
+            self._fb32[y, x] = color
 
-    def set(self, x: int, y: int, rgb: Tuple[int, int, int]):
-        if 0 <= x < self.w and 0 <= y < self.h:
-            self.fb[y, x] = rgb
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: int):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.w, x + w), min(self.h, y + h)
+        if x1 > x0 and y1 > y0:
+            blit_rect(self._fb32, int(x0), int(y0), int(x1), int(y1), int(color))
+
+    def blit_masked(self, ix: int, iy: int, sprite: np.ndarray, mask: np.ndarray):
+        """Copy the ``mask``ed pixels of the packed ``sprite`` to (ix, iy), clipped to the panel."""
+        blit_masked(self._fb32, sprite, mask, int(ix), int(iy))
+
+    def clear_rect(self, x: int, y: int, w: int, h: int):
+        self.fill_rect(x, y, w, h, 0)
 
     def show(self):
+        frame_hash = hash(self._fb32.tobytes())
+        if frame_hash == self._last_hash:
+            return  # unchanged since the last push; skip the DMA
         try:
             self.matrix.show()
+            self._last_hash = frame_hash
         except TimeoutError:
             pass  # drop a frame if DMA busy
 
 
+def rgb32(rgb: Tuple[int, int, int]) -> int:
+    """Pack an (r, g, b) colour into the framebuffer's 0x00RRGGBB word."""
+    r, g, b = rgb
+    return (r << 16) | (g << 8) | b
+
+
+# ───────────────────────────── JIT Kernels ─────────────────────────────────
+@njit(cache=True, fastmath=True)
+def blit_rect(fb, x0, y0, x1, y1, color):
+    for y in range(y0, y1):
+        for x in range(x0, x1):
+            fb[y, x] = color
+
+@njit(cache=True, fastmath=True)
+def blit_masked(fb, sprite, mask, ix, iy):
+    sy0, sx0 = max(0, -iy), max(0, -ix)
+    sy1 = min(mask.shape[0], fb.shape[0] - iy)
+    sx1 = min(mask.shape[1], fb.shape[1] - ix)
+    for sy in range(sy0, sy1):
+        for sx in range(sx0, sx1):
+            if mask[sy, sx]:
+                fb[iy + sy, ix + sx] = sprite[sy, sx]
+
+def warm_jit():
+    """Compile the kernels up front so the first frame isn't JIT-stalled."""
+    fb = np.zeros((1, 1), dtype=np.uint32)
+    blit_rect(fb, 0, 0, 1, 1, 0)
+    blit_masked(fb, fb, np.zeros((1, 1), dtype=bool), 0, 0)
+
+
 # ──────────────────────────── Game Constants ───────────────────────────────
 W, H = 64, 32
 FPS = 15
@@ -60,13 +117,16 @@ PIPE_SPEED = 1
 PIPE_WIDTH = 3
 GAP_HEIGHT = 11
 SPAWN_EVERY = 70
+# Only these reach the Python event queue; SDL drops everything else
+EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP)
+MAX_PIPES = 4          # a pipe lives ~68 frames, so at most 2 are ever on screen
 
-COL_TAIL = (255, 140, 140)
-COL_WING = (255, 165,   0)
-COL_BODY = (255, 255,  50)
-COL_BEAK = (255, 215,   0)
-COL_PIPE = (  0, 255,   0)
-COL_BOOM = (255,   0,   0)
+COL_TAIL = rgb32((255, 140, 140))
+COL_WING = rgb32((255, 165,   0))
+COL_BODY = rgb32((255, 255,  50))
+COL_BEAK = rgb32((255, 215,   0))
+COL_PIPE = rgb32((  0, 255,   0))
+COL_BOOM = rgb32((255,   0,   0))
 
 
 # ─────────────────────────────── Entities ──────────────────────────────────
@@ -105,34 +165,13 @@ class Bird:
     def bbox(self):
         return self.x, self.y, self.x + self.w - 1, self.y + self.h - 1
     def draw(self, d: LEDDisplay):
-        ix, iy = int(self.x), int(self.y)
-        for dy, row in enumerate(Bird.PATTERN):
-            for dx, cell in enumerate(row):
-                if cell:
-                    d.set(ix + dx, iy + dy, Bird.COLOR[cell])
+        d.blit_masked(int(self.x), int(self.y), Bird.SPRITE, Bird.MASK)
 
 
-class Pipe:
-    def __init__(self, x: int):
-        self.x = x
-        self.gap_top = random.randint(4, H - GAP_HEIGHT - 4)
-    def update(self):
-        self.x -= PIPE_SPEED
-    def off_screen(self):
-        return self.x + PIPE_WIDTH < 0
-    def passed(self, bird: Bird):
-        return self.x + PIPE_WIDTH - 1 < bird.x < self.x + PIPE_WIDTH + PIPE_SPEED
-    def collides(self, bird: Bird):
-        bx0, by0, bx1, by1 = bird.bbox()
-        in_x = bx1 >= self.x and bx0 <= self.x + PIPE_WIDTH - 1
-        in_gap = by1 >= self.gap_top and by0 <= self.gap_top + GAP_HEIGHT - 1
-        return in_x and not in_gap
-    def draw(self, d: LEDDisplay):
-        for x in range(self.x, self.x + PIPE_WIDTH):
-            for y in range(0, self.gap_top):
-                d.set(x, y, COL_PIPE)
-            for y in range(self.gap_top + GAP_HEIGHT, H):
-                d.set(x, y, COL_PIPE)
+# Pre-rendered sprite + opacity mask so Bird.draw is a single masked blit
+Bird.SPRITE = np.array([[Bird.COLOR.get(c, 0) for c in row] for row in Bird.PATTERN],
+                       dtype=np.uint32)
+Bird.MASK = np.array([[bool(c) for c in row] for row in Bird.PATTERN])
 
 
 # ───────────────────────────── Game Engine ─────────────────────────────────
@@ -141,15 +180,21 @@ class FlappyGame:
         self.dsp = display
         os.environ["SDL_VIDEODRIVER"] = "dummy"
         pygame.init(); pygame.joystick.init()
+        pygame.event.set_blocked(None); pygame.event.set_allowed(EVENT_TYPES)
         self.pad = pygame.joystick.Joystick(0) if pygame.joystick.get_count() else None
         if self.pad:
             self.pad.init()
+        warm_jit()
+        self.prev_rects = []  # everything drawn last frame, erased before the next
         self.reset(full=True)
 
     # state helpers
     def reset(self, full=False):
         self.bird = Bird()
-        self.pipes: List[Pipe] = []
+        # Pipes as preallocated arrays; only the first n_pipes slots are live
+        self.pipe_x = np.empty(MAX_PIPES, dtype=np.int16)
+        self.pipe_top = np.empty(MAX_PIPES, dtype=np.int16)
+        self.n_pipes = 0
         self.frame = 0
         self.next_spawn = SPAWN_EVERY if full else 0
         self.boom_frames = 0
@@ -161,7 +206,7 @@ class FlappyGame:
     # input
     def process_events(self):
         press = release = quit_req = False
-        for e in pygame.event.get():
+        for e in pygame.event.get(EVENT_TYPES):
             if e.type == pygame.KEYDOWN and e.key == pygame.K_SPACE:
                 press = True
             elif e.type == pygame.KEYUP and e.key == pygame.K_SPACE:
@@ -179,16 +224,28 @@ class FlappyGame:
     def update_world(self):
         self.bird.update()
         if self.frame >= self.next_spawn:
-            self.pipes.append(Pipe(W))
+            if self.n_pipes < MAX_PIPES:
+                self.pipe_x[self.n_pipes] = W
+                self.pipe_top[self.n_pipes] = random.randint(4, H - GAP_HEIGHT - 4)
+                self.n_pipes += 1
             self.next_spawn = self.frame + SPAWN_EVERY
-        for p in list(self.pipes):
-            p.update()
-            if p.off_screen():
-                self.pipes.remove(p)
+        n = self.n_pipes
+        self.pipe_x[:n] -= PIPE_SPEED
+        keep = self.pipe_x[:n] + PIPE_WIDTH >= 0
+        if not keep.all():
+            n = self.n_pipes = int(keep.sum())
+            self.pipe_x[:n] = self.pipe_x[:len(keep)][keep]
+            self.pipe_top[:n] = self.pipe_top[:len(keep)][keep]
         # collisions / bounds
-        out = self.bird.y < 0 or self.bird.y + self.bird.h >= H
-        hit = any(p.collides(self.bird) for p in self.pipes)
-        if out or hit:
+        hit = self.bird.y < 0 or self.bird.y + self.bird.h >= H
+        if not hit and n:
+            # every live pipe against the bird's bbox in one pass
+            bx0, by0, bx1, by1 = self.bird.bbox()
+            px, top = self.pipe_x[:n], self.pipe_top[:n]
+            in_x = (bx1 >= px) & (bx0 <= px + PIPE_WIDTH - 1)
+            in_gap = (by1 >= top) & (by0 <= top + GAP_HEIGHT - 1)
+            hit = bool((in_x & ~in_gap).any())
+        if hit:
             cx = int(self.bird.x + self.bird.w / 2)
             cy = int(self.bird.y + self.bird.h / 2)
             self.trigger_boom(cx, cy)
@@ -196,23 +253,34 @@ class FlappyGame:
 
     # rendering
     def draw(self):
-        d = self.dsp; d.clear()
-        for p in self.pipes:
-            p.draw(d)
+        # Dirty rectangles: erase what was drawn last frame, then redraw
+        d = self.dsp
+        for rect in self.prev_rects:
+            d.clear_rect(*rect)
+        rects = []
+        n = self.n_pipes
+        for px, top in zip(self.pipe_x[:n].tolist(), self.pipe_top[:n].tolist()):
+            bottom = top + GAP_HEIGHT
+            rects += [(px, 0, PIPE_WIDTH, top), (px, bottom, PIPE_WIDTH, H - bottom)]
+            d.fill_rect(px, 0, PIPE_WIDTH, top, COL_PIPE)
+            d.fill_rect(px, bottom, PIPE_WIDTH, H - bottom, COL_PIPE)
         self.bird.draw(d)
+        rects.append((int(self.bird.x), int(self.bird.y), self.bird.w, self.bird.h))
         if self.boom_frames:
             cx, cy = self.boom_pos
-            for dx, dy in [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(1,-1),(-1,1),(1,1)]:
-                d.set(cx + dx, cy + dy, COL_BOOM)
-            d.set(cx, cy, COL_BOOM)
+            rects.append((cx - 1, cy - 1, 3, 3))
+            d.fill_rect(cx - 1, cy - 1, 3, 3, COL_BOOM)
             self.boom_frames -= 1
             if self.boom_frames == 0:
                 self.reset()
+        self.prev_rects = rects
         d.show()
 
     # main loop
     def run(self):
-        clock = pygame.time.Clock()
+        # Fixed-deadline pacing: sleep only for whatever is left of the frame
+        period = 1.0 / FPS
+        next_t = time.monotonic()
         running = True
         while running:
             press, release, quit_req = self.process_events()
@@ -225,7 +293,12 @@ class FlappyGame:
                     self.bird.release_flap()
                 self.update_world()
             self.draw()
-            clock.tick(FPS)
+            next_t += period
+            slack = next_t - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            else:
+                next_t = time.monotonic()  # running late: don't try to catch up
 
 
 # ───────────────────────────── Entrypoint ───────────────────────────────────
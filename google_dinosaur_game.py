@@ -29,27 +29,54 @@ class LEDDisplay:
 
     def __init__(self, w: int, h: int):
         self.w, self.h = w, h
-        self.fb = np.zeros((h, w, 3), dtype=np.uint8)
+        # One 0x00RRGGBB word per pixel, so a pixel write is a single store;
+        # fb is the same memory seen as (h, w, 3) RGB bytes
+        self._fb32 = np.zeros((h, w), dtype=np.uint32)
+        self.fb = self._fb32.view(np.uint8).reshape(h, w, 4)[:, :, 2::-1]
         geom = piomatter.Geometry(width=w, height=h, n_addr_lines=4,
                                   rotation=piomatter.Orientation.Normal)
-        self.matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
+        self.matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888,
                                           pinout=piomatter.Pinout.AdafruitMatrixBonnet,
-                                          framebuffer=self.fb,
+                                          framebuffer=self._fb32,
                                           geometry=geom)
+        self._last_hash = None  # hash of the last frame pushed to the panel
+        self._bg = None
+
+    def set_background(self, bg: np.ndarray):
+        """Packed (h, w) uint32 frame that clear() restores instead of black."""
+        self._bg = bg
 
     def clear(self):
-        self.fb.fill(0)
+        if self._bg is not None:
+            np.copyto(self._fb32, self._bg)
+        else:
+            self._fb32.fill(0)
 
-    def set(self, x: int, y: int, rgb: tuple):
+    def set(self, x: int, y: int, color: int):
         if 0 <= x < self.w and 0 <= y < self.h:
-            self.fb[y, x] = rgb
+            self._fb32[y, x] = color
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: int):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.w, x + w), min(self.h, y + h)
+        if x1 > x0 and y1 > y0:
+            self._fb32[y0:y1, x0:x1] = color
 
     def show(self):
+        frame_hash = hash(self._fb32.tobytes())
+        if frame_hash == self._last_hash:
+            return  # unchanged since the last push; skip the DMA
         try:
             self.matrix.show()
+            self._last_hash = frame_hash
         except TimeoutError:
             pass  # skip on timeout
 
+def rgb32(rgb: tuple) -> int:
+    """Pack an (r, g, b) colour into the framebuffer's 0x00RRGGBB word."""
+    r, g, b = rgb
+    return (r << 16) | (g << 8) | b
+
 # ─────────────────────────── Configuration ───────────────────────────
 W, H = 64, 32
 FPS = 20
@@ -59,10 +86,12 @@ GRAVITY = -0.8
 JUMP_STRENGTH = 8
 OBSTACLE_WIDTH = 4
 OBSTACLE_HEIGHT = 6
-OBSTACLE_COLOR = (0, 255, 0)
-DINO_COLOR = (255, 255, 255)
-GROUND_COLOR = (50, 50, 50)
+OBSTACLE_COLOR = rgb32((0, 255, 0))
+DINO_COLOR = rgb32((255, 255, 255))
+GROUND_COLOR = rgb32((50, 50, 50))
 SPAWN_PROB = 0.02  # chance per frame
+# Only these reach the Python event queue; SDL drops everything else
+EVENT_TYPES = (pygame.JOYBUTTONDOWN,)
 
 # ─────────────────────────── Game Objects ───────────────────────────
 class Dino:
@@ -90,33 +119,13 @@ class Dino:
                 self.vy = 0.0
                 self.on_ground = True
 
-    def pixels(self):
-        x0 = int(self.x)
-        y0 = int(self.y)
-        for px in range(x0, x0 + self.w):
-            for py in range(y0, y0 + self.h):
-                yield px, py
-
-class Obstacle:
-    def __init__(self):
-        self.w = OBSTACLE_WIDTH
-        self.h = OBSTACLE_HEIGHT
-        self.x = W
-        self.y = GROUND_Y - self.h
-
-    def update(self, dt):
-        self.x -= int(120 * dt * FPS / 30)
-
-    def pixels(self):
-        for px in range(int(self.x), int(self.x) + self.w):
-            for py in range(self.y, self.y + self.h):
-                yield px, py
-
 # ───────────────────────────── Game Loop ─────────────────────────────
 def main():
     os.environ["SDL_VIDEODRIVER"] = "dummy"
     pygame.init()
     pygame.joystick.init()
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(EVENT_TYPES)
     if pygame.joystick.get_count() == 0:
         print("No USB gamepad detected – exiting")
         sys.exit(1)
@@ -124,12 +133,20 @@ def main():
     pad.init()
 
     dsp = LEDDisplay(W, H)
-    clock = pygame.time.Clock()
+    # ground line is static, so it lives in the background frame
+    bg = np.zeros((H, W), dtype=np.uint32)
+    bg[GROUND_Y, :] = GROUND_COLOR
+    dsp.set_background(bg)
 
     dino = Dino()
-    obstacles = []
+    # Obstacles all share a size and sit on the ground, so only x varies
+    obs_x = np.empty(0, dtype=np.int16)
+    obs_y = GROUND_Y - OBSTACLE_HEIGHT
 
     last_time = time.time()
+    # Fixed-deadline pacing: sleep only for whatever is left of the frame
+    period = 1.0 / FPS
+    next_t = time.monotonic()
     running = True
 
     while running:
@@ -138,7 +155,7 @@ def main():
         last_time = now
 
         # ─── Input ─────────────────────────────────────────
-        for e in pygame.event.get():
+        for e in pygame.event.get(EVENT_TYPES):
             if e.type == pygame.JOYBUTTONDOWN:
                 if e.button == 0:
                     dino.jump()
@@ -148,35 +165,33 @@ def main():
         # ─── Update ────────────────────────────────────────
         dino.update(dt)
         if random.random() < SPAWN_PROB:
-            obstacles.append(Obstacle())
-        for obs in obstacles:
-            obs.update(dt)
-        obstacles = [o for o in obstacles if o.x + o.w > 0]
+            obs_x = np.append(obs_x, np.int16(W))
+        obs_x -= int(120 * dt * FPS / 30)
+        obs_x = obs_x[obs_x + OBSTACLE_WIDTH > 0]
 
         # ─── Collision ────────────────────────────────────
-        for obs in obstacles:
-            if (dino.x < obs.x + obs.w and
-                dino.x + dino.w > obs.x and
-                dino.y < obs.y + obs.h and
-                dino.y + dino.h > obs.y):
-                dino.reset()
-                obstacles.clear()
-                break
+        if (dino.y < obs_y + OBSTACLE_HEIGHT and
+            dino.y + dino.h > obs_y and
+            ((obs_x < dino.x + dino.w) & (obs_x + OBSTACLE_WIDTH > dino.x)).any()):
+            dino.reset()
+            obs_x = obs_x[:0]
 
         # ─── Draw ────────────────────────────────────────
         dsp.clear()
-        # ground line
-        for x in range(W):
-            dsp.set(x, GROUND_Y, GROUND_COLOR)
-        # dino
-        for px, py in dino.pixels(): dsp.set(px, py, DINO_COLOR)
+        # dino (y is fractional mid-jump)
+        dsp.fill_rect(dino.x, int(dino.y), dino.w, dino.h, DINO_COLOR)
         # obstacles
-        for obs in obstacles:
-            for px, py in obs.pixels(): dsp.set(px, py, OBSTACLE_COLOR)
+        for x in obs_x.tolist():
+            dsp.fill_rect(x, obs_y, OBSTACLE_WIDTH, OBSTACLE_HEIGHT, OBSTACLE_COLOR)
         dsp.show()
 
         # ─── Frame rate ──────────────────────────────────
-        clock.tick(FPS)
+        next_t += period
+        slack = next_t - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
+        else:
+            next_t = time.monotonic()  # running late: don't try to catch up
 
     pygame.quit()
 
@@ -13,7 +13,6 @@ import time
 
 import numpy as np
 import PIL.Image as Image
-from PIL import ImageEnhance
 
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
 
@@ -22,24 +21,32 @@ height = 32
 
 gif_file = "nyan.gif"
 
-canvas = Image.new('RGB', (width, height), (0, 0, 0))
 geometry = piomatter.Geometry(width=width, height=height,
                               n_addr_lines=4, rotation=piomatter.Orientation.Normal)
-framebuffer = np.asarray(canvas) + 0  # Make a mutable copy
+framebuffer = np.zeros((height, width, 3), dtype=np.uint8)
 matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
                              pinout=piomatter.Pinout.AdafruitMatrixBonnet,
                              framebuffer=framebuffer,
                              geometry=geometry)
 
+# Decode every frame once up front; playback is then a plain array copy
+canvas = Image.new('RGB', (width, height), (0, 0, 0))
 with Image.open(gif_file) as img:
     print(f"frames: {img.n_frames}")
-    while True:
-        for i in range(img.n_frames):
-            img.seek(i)
-            frame = img.convert("RGB")
-            enhancer = ImageEnhance.Brightness(frame)
-            dimmer_frame = enhancer.enhance(1.0)
-            canvas.paste(dimmer_frame, (0,0))
-            framebuffer[:] = np.asarray(canvas)
+    frames = np.empty((img.n_frames, height, width, 3), dtype=np.uint8)
+    frame_ids = []  # frames with identical pixels share an id
+    unique = {}
+    for i in range(img.n_frames):
+        img.seek(i)
+        canvas.paste(img.convert("RGB"), (0,0))
+        frames[i] = np.asarray(canvas)
+        frame_ids.append(unique.setdefault(frames[i].tobytes(), i))
+
+shown = None
+while True:
+    for frame, frame_id in zip(frames, frame_ids):
+        if frame_id != shown:  # skip the push when the panel already shows it
+            framebuffer[:] = frame
             matrix.show()
-            time.sleep(0.1)
+            shown = frame_id
+        time.sleep(0.1)
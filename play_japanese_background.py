@@ -23,6 +23,14 @@ API_KEY = "188b74ed419d910f9b947708e31ab32d"
 LATITUDE = "43.879099337335475"
 LONGITUDE = "-79.05372454124822"
 
+WEATHER_ICON_POS = (49, 26)
+WEATHER_ICON_SIZE = (12, 6)
+
+FONT_PATH = "fonts/font_2_5x7.ttf"
+FONT_SIZE = 8
+GLYPH_CHARS = "0123456789: ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+TEXT_COLOR = (191, 191, 191)  # white at 0.75 brightness
+
 
 def get_current_weather_by_coord():
     """
@@ -78,6 +86,58 @@ def get_weather_image(status, weather_img_map):
     return "weather_images/clear.png"
 
 
+def compose_background(background_image, weather_img_path, width, height, top_height):
+    """
+    Render the static layers of a frame -- background art plus weather icon --
+    and return them as an (height, width, 3) uint8 array.
+    """
+    canvas = Image.new('RGB', (width, height), (0, 0, 0))
+    with open(background_image, "rb") as f:
+        img = Image.open(f).convert("RGB")
+        img = img.resize((width, top_height), Image.LANCZOS)
+    enhancer = ImageEnhance.Contrast(img)
+    high_contrast = enhancer.enhance(1.0)
+    # posterized = high_contrast.convert("P", palette=Image.ADAPTIVE, colors=8).convert("RGB") 
+    canvas.paste(high_contrast, (0,0))
+    if weather_img_path is not None:
+        with open(weather_img_path, "rb") as f:
+            weather_img = Image.open(f).convert("RGB").resize(WEATHER_ICON_SIZE, Image.LANCZOS)
+        enhancer = ImageEnhance.Contrast(weather_img)
+        high_contrast = enhancer.enhance(2.5)
+        canvas.paste(high_contrast, WEATHER_ICON_POS)
+    return np.asarray(canvas)
+
+
+def load_glyphs(font, chars, height):
+    """
+    Rasterise each character once into a boolean mask.
+
+    :return: dict mapping char -> (mask array of shape (height, w), x advance)
+    """
+    glyphs = {}
+    for ch in chars:
+        advance = int(round(font.getlength(ch)))
+        glyph = Image.new("L", (max(advance, font.getbbox(ch)[2], 1), height), 0)
+        ImageDraw.Draw(glyph).text((0, 0), ch, font=font, fill=255)
+        glyphs[ch] = (np.asarray(glyph) > 0, advance)
+    return glyphs
+
+
+def render_text(fb, x, y, text, glyphs, color):
+    """
+    Blit ``text`` into the framebuffer at (x, y) from pre-rasterised glyphs.
+    Characters missing from ``glyphs`` are drawn as a space.
+    """
+    fb_h, fb_w, _ = fb.shape
+    for ch in text:
+        mask, advance = glyphs.get(ch) or glyphs[" "]
+        x1 = min(x + mask.shape[1], fb_w)
+        y1 = min(y + mask.shape[0], fb_h)
+        if x1 > x:
+            fb[y:y1, x:x1][mask[:y1 - y, :x1 - x]] = color
+        x += advance
+
+
 def main_display():
     last_weather_call_time = 0
     weather_status, weather_temp, weather_img_path = None, None, None
@@ -94,10 +154,9 @@ def main_display():
     width = 64
     height = 32
 
-    canvas = Image.new('RGB', (width, height), (0, 0, 0))
     geometry = piomatter.Geometry(width=width, height=height,
                                 n_addr_lines=4, rotation=piomatter.Orientation.Normal)
-    framebuffer = np.asarray(canvas) + 0  # Make a mutable copy
+    framebuffer = np.zeros((height, width, 3), dtype=np.uint8)
     matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
                                 pinout=piomatter.Pinout.AdafruitMatrixBonnet,
                                 framebuffer=framebuffer,
@@ -107,6 +166,17 @@ def main_display():
     full_width = 64
     full_height = 32
 
+    # Composited background + weather icon, keyed by (background, weather icon)
+    bg_cache = {}
+    icon_x, icon_y = WEATHER_ICON_POS
+    icon_w, icon_h = WEATHER_ICON_SIZE
+
+    # Use your font
+    font = ImageFont.truetype(FONT_PATH, size=FONT_SIZE)
+    # font = ImageFont.load_bdf("fonts/font_5x7.bdf")
+    # font = ImageFont.truetype("fonts/PixelOperatorMono.ttf", size=9)
+    glyphs = load_glyphs(font, GLYPH_CHARS, full_height - top_height)
+
     while True:
         current_time = time.time()
         # Check if 30 minutes have passed since last weather update
@@ -115,71 +185,33 @@ def main_display():
             if status is not None:
                 weather_status, weather_temp = status, temp
                 print(weather_status, weather_temp)
-                weather_img_path = get_weather_image(weather_status, weather_img_dict)
+                new_img_path = get_weather_image(weather_status, weather_img_dict)
             else:
-                weather_img_path = None
+                new_img_path = None
+            if new_img_path != weather_img_path:
+                bg_cache.clear()
+                weather_img_path = new_img_path
             last_weather_call_time = time.time()
 
 
         for background_image in background_images:
-            canvas = Image.new('RGB', (width, height), (0, 0, 0))
-            if weather_img_path is not None:
-                with open(weather_img_path, "rb") as f:
-                    weather_img = Image.open(f).convert("RGB").resize((12, 6), Image.LANCZOS)
-            else:
-                weather_img = None
-            with open(background_image, "rb") as f:
-                img = Image.open(f).convert("RGB")
-                img = img.resize((full_width, top_height), Image.LANCZOS)
-
-            draw = ImageDraw.Draw(canvas)
+            key = (background_image, weather_img_path)
+            base = bg_cache.get(key)
+            if base is None:
+                base = bg_cache[key] = compose_background(background_image, weather_img_path,
+                                                          full_width, full_height, top_height)
 
-            # Use your font
-            font = ImageFont.truetype("fonts/font_2_5x7.ttf", size=8)
-            # font = ImageFont.load_bdf("fonts/font_5x7.bdf")
-            # font = ImageFont.truetype("fonts/PixelOperatorMono.ttf", size=9)
+            framebuffer[:] = base
 
             # Get timestamp
             now = datetime.now()
             timestamp = now.strftime("%H:%M %b%d")
-            draw.text((0, 25), timestamp, font=font, fill=(255, 255, 255))
-
-            # Fixed pixel width per character (experimentally chosen)
-            # char_width = 4  # Try 5 or 6 depending on your font + size
-            # char_spacing = 0  # Or try 1 if needed
-            # step = char_width + char_spacing
-
-            # # Total width for centering
-            # total_width = len(timestamp) * step
-            # x_start = 1#(full_width - total_width) // 2
-            # y = top_height
-
-            # # Draw each character with fixed step
-            # x = x_start
-            # for char in timestamp:
-            #     draw.text((x, y), char, font=font, fill=(255, 255, 255))
-            #     x += step
-
-            # Then crop out the region holding the text
-            text_region_box = (0, top_height, 47, height)
-            text_region = canvas.crop(text_region_box)
-
-            # Apply brightness or contrast
-            enhancer = ImageEnhance.Brightness(text_region)
-            brighter_region = enhancer.enhance(0.75)  # e.g. double the brightness
-
-            # Paste back
-            canvas.paste(brighter_region, text_region_box)
-        
-            enhancer = ImageEnhance.Contrast(img)
-            high_contrast = enhancer.enhance(1.0)
-            # posterized = high_contrast.convert("P", palette=Image.ADAPTIVE, colors=8).convert("RGB") 
-            canvas.paste(high_contrast, (0,0))
-            if weather_img is not None:
-                enhancer = ImageEnhance.Contrast(weather_img)
-                high_contrast = enhancer.enhance(2.5)
-                canvas.paste(high_contrast, (49, 26))
-            framebuffer[:] = np.asarray(canvas)
+            render_text(framebuffer, 0, top_height, timestamp, glyphs, TEXT_COLOR)
+
+            if weather_img_path is not None:
+                # The weather icon sits on top of the timestamp strip
+                framebuffer[icon_y:icon_y + icon_h, icon_x:icon_x + icon_w] = \
+                    base[icon_y:icon_y + icon_h, icon_x:icon_x + icon_w]
             matrix.show()
             time.sleep(10)
 
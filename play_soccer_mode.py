@@ -7,10 +7,11 @@ import signal
 import sys
 import socket
 import struct
-import cv2
+from collections import deque
 import numpy as np
 from picamera2 import Picamera2
 from PIL import Image, ImageEnhance, ImageSequence, ImageFont, ImageDraw
+from turbojpeg import TurboJPEG, TJPF_BGR
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
 
 # Configuration
@@ -23,13 +24,41 @@ GOAL_TEXT_POS = (2, 2)
 TEXT_COLOR = (255, 255, 255)
 BG_COLOR = (0, 0, 0)
 PADDING = 1
+JPEG_QUALITY = 95  # what cv2.imencode used by default
+SNDBUF_BYTES = 1 << 20  # room for a few JPEG frames; the kernel caps it at wmem_max
 
 # Global picamera instance for cleanup
 global_picam2 = None
 
+def send_frame(sock, hdr, data):
+    """
+    Send ``data`` behind its 4-byte big-endian length without concatenating them.
+    ``hdr`` is a reusable 4-byte bytearray.
+    """
+    struct.pack_into('>L', hdr, 0, len(data))
+    bufs = [memoryview(hdr), memoryview(data)]
+    while bufs:
+        sent = sock.sendmsg(bufs)
+        # sendmsg may stop short; drop what went out and resend the rest
+        while bufs and sent >= len(bufs[0]):
+            sent -= len(bufs[0])
+            bufs.pop(0)
+        if bufs:
+            bufs[0] = bufs[0][sent:]
+
+
+def frame_capture(picam2, latest):
+    """
+    Thread to keep only the newest Picamera2 frame in ``latest`` (a 1-slot deque),
+    so a slow encode/send drops stale frames instead of falling behind.
+    """
+    while True:
+        latest.append(picam2.capture_array())
+
+
 def frame_sender(picam2):
     """
-    Thread to capture frames from shared Picamera2 and send via TCP.
+    Thread to encode the newest captured frame and send via TCP.
     """
     # Retry connecting
     sock = None
@@ -38,14 +67,23 @@ def frame_sender(picam2):
             sock = socket.create_connection((SERVER_IP, SERVER_PORT))
         except Exception:
             time.sleep(2)
+    # Push each frame out immediately rather than waiting to coalesce
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SNDBUF_BYTES)
+    hdr = bytearray(4)
+    # libjpeg-turbo reads the camera's BGR buffer as is
+    jpeg = TurboJPEG()
+    latest = deque(maxlen=1)
+    threading.Thread(target=frame_capture, args=(picam2, latest), daemon=True).start()
     # Send loop
     while True:
-        frame = picam2.capture_array()
-        bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-        _, jpeg = cv2.imencode('.jpg', bgr)
-        data = jpeg.tobytes()
-        sock.sendall(struct.pack('>L', len(data)) + data)
-        time.sleep(0.07)
+        try:
+            frame = latest.popleft()
+        except IndexError:
+            time.sleep(0.005)  # nothing new captured yet
+            continue
+        data = jpeg.encode(frame, quality=JPEG_QUALITY, pixel_format=TJPF_BGR)
+        send_frame(sock, hdr, data)
 
 
 def goal_listener(goal_event):
@@ -57,6 +95,20 @@ def goal_listener(goal_event):
             goal_event.set()
 
 
+def bake_gif(gif, size):
+    """
+    Resize and contrast-boost every frame of ``gif`` once, up front.
+
+    :return: list of (uint8 frame array, frame duration in seconds)
+    """
+    frames = []
+    for frame in ImageSequence.Iterator(gif):
+        rgb = frame.convert("RGB").resize(size, Image.BILINEAR)
+        enhanced = ImageEnhance.Contrast(rgb).enhance(1.5)
+        frames.append((np.asarray(enhanced), frame.info.get("duration", 100)/1000.0))
+    return frames
+
+
 def cleanup(signum, frame):
     # Gracefully stop camera on exit
     global global_picam2
@@ -78,7 +130,8 @@ def main_display():
     # Initialize camera
     picam2 = Picamera2()
     global_picam2 = picam2
-    picam2.configure(picam2.create_video_configuration(main={"size": (640, 480)}))
+    # Picamera2's "RGB888" is B, G, R in memory: 3 bytes/pixel instead of XBGR8888's 4
+    picam2.configure(picam2.create_video_configuration(main={"size": (640, 480), "format": "RGB888"}))
     picam2.start()
 
     # Setup LED matrix
@@ -108,8 +161,14 @@ def main_display():
         rocket1_gif,
         rocket2_gif
     ]
+    # Animations are baked to panel-sized arrays so playback is just a copy
+    goal_frames = bake_gif(goal_gif, (width, height))
+    celebration_frames = [bake_gif(gif, (width, height)) for gif in celebration_gifs]
     font = ImageFont.truetype(FONT_PATH, size=FONT_SIZE)
 
+    text_glyphs = {}  # text -> (font.getbbox(text), bool ink mask)
+    shown_count = None  # goal count currently on the panel
+
     goal_count = 231
     goal_event = threading.Event()
 
@@ -120,42 +179,46 @@ def main_display():
     # Display loop
     while True:
         if goal_event.is_set():
-            for frame in ImageSequence.Iterator(goal_gif):
-                rgb = frame.convert("RGB").resize((width, height), Image.LANCZOS)
-                enhanced = ImageEnhance.Contrast(rgb).enhance(1.5)
-                framebuffer[:] = np.asarray(enhanced)
+            for frame, duration in goal_frames:
+                framebuffer[:] = frame
                 matrix.show()
-                time.sleep(frame.info.get("duration", 100)/1000.0)
+                time.sleep(duration)
             goal_count += 1
             goal_event.clear()
             if goal_count % 10 == 0:
-                random_gif = random.choice(celebration_gifs)
-                num_frames = random_gif.n_frames
+                random_gif = random.choice(celebration_frames)
+                num_frames = len(random_gif)
                 num_loops = 20 // num_frames
                 if num_loops == 0:
                     num_loops = 1
                 for _ in range(num_loops):
-                    for frame in ImageSequence.Iterator(random_gif):
-                        rgb = frame.convert("RGB").resize((width, height), Image.LANCZOS)
-                        enhanced = ImageEnhance.Contrast(rgb).enhance(1.5)
-                        framebuffer[:] = np.asarray(enhanced)
+                    for frame, duration in random_gif:
+                        framebuffer[:] = frame
                         matrix.show()
-                        time.sleep(frame.info.get("duration", 100)/1000.0)
-        else:
-            base_img = Image.fromarray(default_frame.copy())
-            draw = ImageDraw.Draw(base_img)
+                        time.sleep(duration)
+        elif goal_count != shown_count:
             text = str(goal_count)
-            # Measure text size via font.getbbox()
-            bbox = font.getbbox(text)
+            glyph = text_glyphs.get(text)
+            if glyph is None:
+                # Rasterise the count once into an ink mask anchored at the text origin
+                bbox = font.getbbox(text)
+                ink = Image.new("L", (bbox[2], bbox[3]), 0)
+                ImageDraw.Draw(ink).text((0, 0), text, fill=255, font=font)
+                glyph = text_glyphs[text] = (bbox, np.asarray(ink) > 0)
+            bbox, mask = glyph
             text_w = bbox[2] - bbox[0]
             text_h = bbox[3] - bbox[1]
             x, y = GOAL_TEXT_POS
+            # A goal animation or a wider previous count may have left pixels behind
+            framebuffer[:] = default_frame
             # background rect
-            draw.rectangle([x-PADDING, y-PADDING, x+text_w+PADDING, y+text_h+PADDING], fill=BG_COLOR)
-            draw.text((x, y), text, fill=TEXT_COLOR, font=font)
-            framebuffer[:] = np.asarray(base_img)
+            framebuffer[max(0, y-PADDING):y+text_h+PADDING+1, max(0, x-PADDING):x+text_w+PADDING+1] = BG_COLOR
+            ink_area = framebuffer[y:y+mask.shape[0], x:x+mask.shape[1]]
+            ink_area[mask[:ink_area.shape[0], :ink_area.shape[1]]] = TEXT_COLOR
             matrix.show()
-            time.sleep(0.01)
+            shown_count = goal_count
+        else:
+            time.sleep(0.05)
 
 if __name__ == "__main__":
     main_display()
\ No newline at end of file
@@ -10,12 +10,19 @@ Usage:
     --model movenet_thunder_int8.tflite \
     [--min-conf 0.05] [--no-preview]
 
+Full-integer int8 models from quantize_movenet.py work as-is: the input is
+zero-point shifted and the keypoints are dequantized here.
+
 Flags:
   --min-conf      Landmark confidence threshold (default 0.2)
+  --delegate      TFLite delegate library to run the model on, e.g.
+                  libxnnpack_delegate.so (default: built-in kernels)
+  --cpus          Pin the process to these CPUs, e.g. 0-3 or 2,3 (default: any)
   --no-preview    Disable MJPEG preview (only matrix output)
   --no-matrix     Disable LED matrix output (stream only)
 """
 import argparse
+import os
 import threading
 import time
 from pathlib import Path
@@ -23,8 +30,10 @@ from pathlib import Path
 import cv2
 import numpy as np
 from flask import Flask, Response, render_template_string, stream_with_context
+from numba import njit
 from picamera2 import Picamera2
-from tflite_runtime.interpreter import Interpreter
+from tflite_runtime.interpreter import Interpreter, load_delegate
+from turbojpeg import TurboJPEG, TJPF_RGB
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
 
 # Pose skeleton edges (COCO order)
@@ -34,17 +43,23 @@ EDGES = [
     (5, 6), (5, 11), (6, 12), (11, 12),
     (11, 13), (13, 15), (12, 14), (14, 16),
 ]
+EDGE_IDX = np.array(EDGES, dtype=np.int32)
+N_KPTS = 17
 # Visualization colors (BGR)
 CV_SKEL   = (0, 255, 0)
 CV_DOT    = (0, 255, 255)
 CV_BOX    = (255, 255, 0)
+# The preview is drawn straight onto the RGB capture, so flip them once
+RGB_SKEL, RGB_DOT = CV_SKEL[::-1], CV_DOT[::-1]
+JPEG_QUALITY = 80
 # Matrix LED color (g, r, b)
 MAT_COLOR = (0, 255, 0)
 
 # Flask app
 app = Flask(__name__)
 latest_jpeg = None
-jpeg_lock = threading.Lock()
+jpeg_ready = threading.Condition()  # guards latest_jpeg; notified on every new frame
+preview_clients = 0  # open /video_feed streams; no encoding while this is 0
 
 PREVIEW_HTML = """
 <!doctype html>
@@ -61,33 +76,63 @@ def index():
 @app.route("/video_feed")
 def video_feed():
     def gen():
-        while True:
-            with jpeg_lock:
-                frame = latest_jpeg
-            if frame:
+        global preview_clients
+        with jpeg_ready:
+            preview_clients += 1
+        try:
+            frame = None
+            while True:
+                with jpeg_ready:
+                    # Each client wakes for every new frame; the timeout only rechecks the
+                    # predicate if the inference thread stalls
+                    if not jpeg_ready.wait_for(lambda: latest_jpeg is not frame, timeout=1.0):
+                        continue
+                    frame = latest_jpeg
                 yield (b'--frame\r\nContent-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
-            time.sleep(0.04)
+        finally:  # runs when Flask closes the stream on disconnect
+            with jpeg_ready:
+                preview_clients -= 1
     return Response(stream_with_context(gen()), mimetype='multipart/x-mixed-replace; boundary=frame')
 
-# Bresenham for matrix lines
-def draw_line_matrix(buf, x0, y0, x1, y1, color):
-    dx, dy = abs(x1 - x0), -abs(y1 - y0)
-    sx, sy = (1, -1)[x0 > x1], (1, -1)[y0 > y1]
-    err = dx + dy
-    h, w, _ = buf.shape
-    while True:
-        if 0 <= x0 < w and 0 <= y0 < h:
-            buf[y0, x0] = color
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 >= dy:
-            err += dy; x0 += sx
-        if e2 <= dx:
-            err += dx; y0 += sy
+# Bresenham for matrix lines, JIT-compiled: the whole skeleton in one native call
+@njit(cache=True, boundscheck=False)
+def draw_skeleton(buf, pts_xy, edges, color):
+    """Draw every edge whose endpoints are both present (x >= 0) in pts_xy."""
+    h, w = buf.shape[0], buf.shape[1]
+    for e in range(edges.shape[0]):
+        a, b = edges[e, 0], edges[e, 1]
+        if pts_xy[a, 0] < 0 or pts_xy[b, 0] < 0:
+            continue
+        x0, y0 = pts_xy[a, 0], pts_xy[a, 1]
+        x1, y1 = pts_xy[b, 0], pts_xy[b, 1]
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx = -1 if x0 > x1 else 1
+        sy = -1 if y0 > y1 else 1
+        err = dx + dy
+        while True:
+            if 0 <= x0 < w and 0 <= y0 < h:
+                buf[y0, x0, 0] = color[0]
+                buf[y0, x0, 1] = color[1]
+                buf[y0, x0, 2] = color[2]
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy; x0 += sx
+            if e2 <= dx:
+                err += dx; y0 += sy
+
+def parse_cpus(spec):
+    """Turn a taskset-style CPU list such as '0-3' or '1,3' into a set of ints."""
+    cpus = set()
+    for part in spec.split(','):
+        lo, _, hi = part.partition('-')
+        cpus.update(range(int(lo), int(hi or lo) + 1))
+    return cpus
 
 # Inference loop
-def inference_loop(model_path, threads, rows, cols, chain, alpha, min_conf, use_matrix, use_preview):
+def inference_loop(model_path, threads, rows, cols, chain, alpha, min_conf, use_matrix, use_preview,
+                   delegate=None):
     global latest_jpeg
 
     # Camera init RGB
@@ -96,12 +141,21 @@ def inference_loop(model_path, threads, rows, cols, chain, alpha, min_conf, use_
     cam.start()
 
     # Interpreter
-    interpreter = Interpreter(model_path=str(model_path), num_threads=threads)
+    delegates = [load_delegate(delegate)] if delegate else None
+    interpreter = Interpreter(model_path=str(model_path), num_threads=threads,
+                              experimental_delegates=delegates)
     interpreter.allocate_tensors()
     inp = interpreter.get_input_details()[0]
     out = interpreter.get_output_details()[0]
     in_idx, out_idx = inp['index'], out['index']
     dtype = inp['dtype']
+    in_scale, in_zero = inp['quantization']
+    # Full-int8 MoveNet takes q = pixel - 128, i.e. each uint8 pixel with its top bit flipped
+    int8_shift = dtype == np.int8 and (in_scale, in_zero) == (1.0, -128)
+    # Integer outputs (full-int8 export) are dequantized back to [0, 1] / score units
+    out_quant = out['quantization'] if out['dtype'] != np.float32 else None
+    # The mirrored capture is cast straight into the interpreter's own input buffer
+    in_tensor = interpreter.tensor(in_idx)
 
     # Matrix init
     if use_matrix:
@@ -109,60 +163,74 @@ def inference_loop(model_path, threads, rows, cols, chain, alpha, min_conf, use_
         geo = piomatter.Geometry(width=width, height=rows, n_addr_lines=4, rotation=piomatter.Orientation.Normal)
         fb = np.zeros((rows, width, 3), dtype=np.uint8)
         panel = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed, pinout=piomatter.Pinout.AdafruitMatrixBonnet, framebuffer=fb, geometry=geo)
+        scale = np.array([width, rows])  # 256x256 camera coords -> matrix (x, y)
     else:
         fb = None
 
-    prev_pts = None
+    # Compile the rasteriser now rather than on the first frame
+    mapped = np.full((N_KPTS, 2), -1, dtype=np.int32)
+    draw_skeleton(np.zeros((1, 1, 3), dtype=np.uint8), mapped, EDGE_IDX, MAT_COLOR)
+
+    jpeg = TurboJPEG() if use_preview else None
+    vis = None  # preview canvas, allocated on the first encoded frame and reused
+
+    # Keypoints as (17, 2) int32 x, y arrays plus a validity mask; invalid rows hold -1
+    prev_pts = np.full((N_KPTS, 2), -1, dtype=np.int32)
+    prev_ok = np.zeros(N_KPTS, dtype=bool)
     t0 = time.time(); count = 0
     while True:
         # Capture + mirror
         rgb = cam.capture_array('main')[:, ::-1]
 
         # Prepare tensor
+        buf = in_tensor()[0]
         if dtype == np.float32:
-            inp_img = rgb.astype(np.float32)/255.0
+            np.divide(rgb, np.float32(255), out=buf, dtype=np.float32)
+        elif int8_shift:
+            np.bitwise_xor(rgb, 0x80, out=buf.view(np.uint8))
+        elif dtype == np.int8:
+            np.copyto(buf, np.clip(np.rint(rgb/in_scale + in_zero), -128, 127), casting='unsafe')
         else:
-            inp_img = rgb.astype(dtype)
-        tensor = np.expand_dims(inp_img, 0)
+            np.copyto(buf, rgb, casting='unsafe')
+        del buf  # invoke() refuses to run while a view of its buffers is alive
 
         # Inference
-        interpreter.set_tensor(in_idx, tensor)
         interpreter.invoke()
         kps = interpreter.get_tensor(out_idx)[0,0]
+        if out_quant:
+            kps = (kps.astype(np.float32) - out_quant[1]) * out_quant[0]
 
-        # Decode
-        pts = [None if s<min_conf else (int(x*256),int(y*256)) for y,x,s in kps]
-        # Smooth
-        if prev_pts is None:
-            sm = pts
-        else:
-            sm=[]
-            for c,p in zip(pts,prev_pts):
-                if c and p:
-                    sm.append((int(alpha*c[0]+(1-alpha)*p[0]), int(alpha*c[1]+(1-alpha)*p[1])))
-                else:
-                    sm.append(c or p)
-        prev_pts = sm
+        # Decode (kps rows are y, x, score)
+        ok = kps[:, 2] >= min_conf
+        cur = (kps[:, 1::-1]*256).astype(np.int32)
+        # Smooth: EMA where both frames have the point, else whichever one does
+        blend = (alpha*cur + (1-alpha)*prev_pts).astype(np.int32)
+        sm = np.where((ok & prev_ok)[:, None], blend, np.where(ok[:, None], cur, prev_pts))
+        sm_ok = ok | prev_ok
+        prev_pts, prev_ok = sm, sm_ok
+        # Edges with both endpoints present, shared by the preview and the matrix
+        edges = EDGE_IDX[sm_ok[EDGE_IDX].all(axis=1)]
 
         # Preview
-        if use_preview:
-            bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
-            vis = bgr.copy()
-            for pt in sm:
-                if pt: cv2.circle(vis, pt, 3, CV_DOT, -1)
-            for a,b in EDGES:
-                if sm[a] and sm[b]: cv2.line(vis, sm[a], sm[b], CV_SKEL, 1)
-            ok,buf = cv2.imencode('.jpg', vis, [cv2.IMWRITE_JPEG_QUALITY,80])
-            if ok:
-                with jpeg_lock: latest_jpeg=buf.tobytes()
+        if use_preview and preview_clients:
+            if vis is None:
+                vis = np.empty(rgb.shape, dtype=rgb.dtype)
+            np.copyto(vis, rgb)
+            pts = [tuple(pt) for pt in sm.tolist()]
+            for i in np.flatnonzero(sm_ok):
+                cv2.circle(vis, pts[i], 3, RGB_DOT, -1)
+            for a,b in edges.tolist():
+                cv2.line(vis, pts[a], pts[b], RGB_SKEL, 1)
+            data = jpeg.encode(vis, quality=JPEG_QUALITY, pixel_format=TJPF_RGB)
+            with jpeg_ready:
+                latest_jpeg=data
+                jpeg_ready.notify_all()
 
         # Matrix draw
         if fb is not None:
             fb.fill(0)
-            hm,wm = fb.shape[0], fb.shape[1]
-            mapped=[None if p is None else (int(p[0]*wm/256), int(p[1]*hm/256)) for p in sm]
-            for a,b in EDGES:
-                if mapped[a] and mapped[b]: draw_line_matrix(fb, *mapped[a], *mapped[b], MAT_COLOR)
+            mapped[:] = np.where(sm_ok[:, None], sm*scale/256, -1)
+            draw_skeleton(fb, mapped, edges, MAT_COLOR)
             panel.show()
 
         # FPS
@@ -182,13 +250,18 @@ if __name__=='__main__':
     p.add_argument('--min-conf',type=float,default=0.2)
     p.add_argument('--no-preview',action='store_true')
     p.add_argument('--no-matrix',action='store_true')
+    p.add_argument('--delegate',default=None)
+    p.add_argument('--cpus',type=parse_cpus,default=None)
     p.add_argument('--host',default='0.0.0.0')
     p.add_argument('--port',type=int,default=5000)
     args=p.parse_args()
+    if args.cpus:
+        # Threads started from here on (tflite's pool included) inherit the mask
+        os.sched_setaffinity(0, args.cpus)
 
     t=threading.Thread(target=inference_loop,args=(
         args.model,args.threads,args.rows,args.cols,args.chain,
-        args.alpha,args.min_conf,not args.no_matrix,not args.no_preview),daemon=True)
+        args.alpha,args.min_conf,not args.no_matrix,not args.no_preview,args.delegate),daemon=True)
     t.start()
 
     if not args.no_preview:
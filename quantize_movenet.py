@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+MoveNet Full-Integer Quantizer (offline)
+========================================
+Re-exports a MoveNet SavedModel as a full-integer int8 .tflite for
+pose_estimation.py. Every op is quantized with a representative dataset,
+so none fall back to float kernels on the Pi, and the input/output tensors
+are int8 too.
+
+Run this on a desktop with TensorFlow installed, not on the Pi.
+
+Usage:
+  python3 quantize_movenet.py \
+    --saved-model movenet_thunder_saved_model \
+    --images calib_images/ \
+    [--samples 100] [--out model_artifacts/movenet_thunder_full_int8.tflite]
+
+Then check on the Pi that nothing falls back to reference kernels:
+  benchmark_model --graph=model_artifacts/movenet_thunder_full_int8.tflite \
+    --use_xnnpack=true --enable_op_profiling=true
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+from PIL import Image
+
+IMAGE_EXTS = {'.jpg', '.jpeg', '.png', '.bmp'}
+
+
+def representative_images(image_dir, size, samples):
+    """Yield up to ``samples`` RGB frames from ``image_dir`` resized to ``size``."""
+    paths = sorted(p for p in Path(image_dir).iterdir() if p.suffix.lower() in IMAGE_EXTS)
+    if not paths:
+        raise SystemExit(f"No calibration images found in {image_dir}")
+    for path in paths[:samples]:
+        with Image.open(path) as img:
+            yield np.asarray(img.convert('RGB').resize(size, Image.BILINEAR))
+
+
+def main():
+    p=argparse.ArgumentParser()
+    p.add_argument('--saved-model',type=Path,required=True)
+    p.add_argument('--images',type=Path,required=True)
+    p.add_argument('--samples',type=int,default=100)
+    p.add_argument('--out',type=Path,default=Path('model_artifacts/movenet_thunder_full_int8.tflite'))
+    args=p.parse_args()
+
+    # Calibration frames must match the SavedModel's own input size and dtype
+    sig = tf.saved_model.load(str(args.saved_model)).signatures['serving_default']
+    spec = next(iter(sig.structured_input_signature[1].values()))
+    _, h, w, _ = spec.shape
+    in_dtype = spec.dtype.as_numpy_dtype
+
+    def gen():
+        for img in representative_images(args.images, (w, h), args.samples):
+            yield [img[None].astype(in_dtype)]
+
+    converter = tf.lite.TFLiteConverter.from_saved_model(str(args.saved_model))
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = gen
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    args.out.write_bytes(converter.convert())
+
+    # Report the I/O quantization pose_estimation.py will see
+    interpreter = tf.lite.Interpreter(model_path=str(args.out))
+    for kind, det in (('input', interpreter.get_input_details()[0]),
+                      ('output', interpreter.get_output_details()[0])):
+        print(f"{kind}: {det['dtype'].__name__} {det['shape']} (scale, zero_point)={det['quantization']}")
+    print(f"Wrote {args.out}")
+
+
+if __name__=='__main__':
+    main()
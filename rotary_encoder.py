@@ -8,44 +8,43 @@ import time
 import board
 import busio
 from adafruit_seesaw.seesaw   import Seesaw
-from adafruit_seesaw.rotaryio import IncrementalEncoder
-from adafruit_seesaw.digitalio import DigitalIO
-import digitalio                               # Direction & Pull live here
 
 ENCODER_ADDRS = (0x36, 0x38)      # whatever i2cdetect shows
+BTN_PIN  = 24                     # switch on seesaw pin 24
+BTN_MASK = 1 << BTN_PIN
+POLL_S   = 0.02                   # no INT line wired, so poll every 20 ms
 
 # Bring up I²C once
 i2c = busio.I2C(board.SCL, board.SDA)
 
-# One object set per encoder
+# One seesaw per encoder
 encoders = []
 for addr in ENCODER_ADDRS:
-    ss  = Seesaw(i2c, addr=addr)
-    enc = IncrementalEncoder(ss)
-    btn = DigitalIO(ss, 24)                     # switch on seesaw pin 24
-    btn.direction = digitalio.Direction.INPUT
-    btn.pull      = digitalio.Pull.UP           # active-low
+    ss = Seesaw(i2c, addr=addr)
+    ss.pin_mode(BTN_PIN, ss.INPUT_PULLUP)       # active-low
     encoders.append({"addr": addr,
-                     "enc":  enc,
-                     "btn":  btn,
-                     "last": enc.position})
+                     "ss":   ss,
+                     "last": ss.encoder_position(),
+                     "down": False})
 
 print("Running…  Ctrl-C to quit")
 try:
     while True:
         for dev in encoders:
-            pos = dev["enc"].position
+            ss = dev["ss"]
+            pos = ss.encoder_position()
             if pos != dev["last"]:
                 delta = pos - dev["last"]
                 print(f"[0x{dev['addr']:02X}] rotate {delta:+d}  (abs {pos})")
                 dev["last"] = pos
 
-            if not dev["btn"].value:            # button pressed
+            # One bulk GPIO read; report the press edge only, without blocking
+            down = not ss.digital_read_bulk(BTN_MASK)
+            if down and not dev["down"]:
                 print(f"[0x{dev['addr']:02X}] ↵  button press")
-                while not dev["btn"].value:     # crude debounce
-                    time.sleep(0.01)
+            dev["down"] = down
 
-        time.sleep(0.005)
+        time.sleep(POLL_S)
 
 except KeyboardInterrupt:
     print("\nBye!")
@@ -12,23 +12,45 @@ logging.basicConfig(
 
 SERVER_IP = "192.168.86.39"
 SERVER_PORT = 9000
+SNDBUF_BYTES = 1 << 20  # room for a few JPEG frames; the kernel caps it at wmem_max
 
 def connect():
     while True:
         try:
             print("Connecting...")
             sock = socket.create_connection((SERVER_IP, SERVER_PORT))
+            # Push each frame out immediately rather than waiting to coalesce
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SNDBUF_BYTES)
             print("Connected.")
             return sock
         except Exception as e:
             print("Retrying in 2 seconds...", e)
             time.sleep(2)
 
+def send_frame(sock, hdr, data):
+    """
+    Send ``data`` behind its 4-byte big-endian length without concatenating them.
+    ``hdr`` is a reusable 4-byte bytearray.
+    """
+    struct.pack_into('>L', hdr, 0, len(data))
+    bufs = [memoryview(hdr), memoryview(data)]
+    while bufs:
+        sent = sock.sendmsg(bufs)
+        # sendmsg may stop short; drop what went out and resend the rest
+        while bufs and sent >= len(bufs[0]):
+            sent -= len(bufs[0])
+            bufs.pop(0)
+        if bufs:
+            bufs[0] = bufs[0][sent:]
+
 picam2 = Picamera2()
-picam2.configure(picam2.create_video_configuration(main={"size": (640, 480)}))
+# Picamera2's "RGB888" is B, G, R in memory -- already what cv2.imencode wants
+picam2.configure(picam2.create_video_configuration(main={"size": (640, 480), "format": "RGB888"}))
 picam2.start()
 
 sock = connect()
+hdr = bytearray(4)
 
 while True:
     try:
@@ -36,12 +58,10 @@ while True:
         capture_start = time.perf_counter()
 
         frame = picam2.capture_array()
-        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-        _, jpeg = cv2.imencode('.jpg', frame)
-        data = jpeg.tobytes()
+        _, data = cv2.imencode('.jpg', frame)  # 1-D uint8 array; sendmsg takes it as is
 
         encode_end = time.perf_counter()
-        sock.sendall(struct.pack('>L', len(data)) + data)
+        send_frame(sock, hdr, data)
         send_end = time.perf_counter()
 
         # --- Print timings
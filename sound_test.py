@@ -29,11 +29,12 @@ def list_alsa_cards() -> None:
 def play_sine(freq_hz: float = 440.0, seconds: float = 2.0, volume: float = 0.4):
     """Generate and play a sine wave via simpleaudio."""
     sample_rate = 44_100  # Hz
-    t = np.linspace(0, seconds, int(sample_rate * seconds), endpoint=False)
-    wave = (volume * np.sin(2 * np.pi * freq_hz * t)).astype(np.float32)
+    n = int(sample_rate * seconds)
+    k = 2 * np.pi * freq_hz / sample_rate  # phase step per sample
 
-    # simpleaudio expects 16-bit PCM; convert:
-    pcm16 = (wave * 32767).astype(np.int16)
+    # simpleaudio expects 16-bit PCM; synthesise in float32 and scale straight to it
+    phase = k * np.arange(n, dtype=np.float32)
+    pcm16 = (volume * 32767 * np.sin(phase, out=phase)).astype(np.int16)
     audio = sa.play_buffer(pcm16, 1, 2, sample_rate)
     audio.wait_done()
 
@@ -40,14 +40,24 @@ class LEDDisplay:
             framebuffer=self.fb,
             geometry=geom
         )
+        self._last_hash = None  # hash of the last frame pushed to the panel
     def clear(self):
         self.fb.fill(0)
     def set(self, x: int, y: int, rgb: tuple):
         if 0 <= x < self.w and 0 <= y < self.h:
             self.fb[y, x] = rgb
+    def fill_rect(self, x: int, y: int, w: int, h: int, rgb: tuple):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.w, x + w), min(self.h, y + h)
+        if x1 > x0 and y1 > y0:
+            self.fb[y0:y1, x0:x1] = rgb
     def show(self):
+        frame_hash = hash(self.fb.tobytes())
+        if frame_hash == self._last_hash:
+            return  # unchanged since the last push; skip the DMA
         try:
             self.matrix.show()
+            self._last_hash = frame_hash
         except TimeoutError:
             pass
 
@@ -99,12 +109,11 @@ class Runner:
                 self.y = GROUND_Y - self.h
                 self.vy = 0.0
                 self.on_ground = True
-    def pixels(self):
-        x0 = int(self.x - self.w // 2)
-        y0 = int(self.y)
-        for px in range(x0, x0 + self.w):
-            for py in range(y0, y0 + self.h):
-                yield px, py
+    @property
+    def rect(self):
+        """Occupied pixels as a half-open (x0, y0, x1, y1) box."""
+        x0, y0 = int(self.x - self.w // 2), int(self.y)
+        return x0, y0, x0 + self.w, y0 + self.h
 
 class Obstacle:
     def __init__(self):
@@ -114,11 +123,10 @@ class Obstacle:
         self.y = GROUND_Y - self.h
     def update(self, dt):
         self.x -= int(100 * dt * FPS / 30)
-    def pixels(self):
+    @property
+    def rect(self):
         x0 = int(self.x - self.w // 2)
-        for px in range(x0, x0 + self.w):
-            for py in range(self.y, self.y + self.h):
-                yield px, py
+        return x0, self.y, x0 + self.w, self.y + self.h
 
 class Coin:
     def __init__(self):
@@ -128,12 +136,14 @@ class Coin:
         self.y = GROUND_Y - self.h - 2 if hasattr(self, 'h') else GROUND_Y - self.sz - 1
     def update(self, dt):
         self.x -= int(120 * dt * FPS / 30)
-    def pixels(self):
-        x0 = int(self.x - self.sz // 2)
-        y0 = GROUND_Y - self.sz - 1
-        for px in range(x0, x0 + self.sz):
-            for py in range(y0, y0 + self.sz):
-                yield px, py
+    @property
+    def rect(self):
+        x0, y0 = int(self.x - self.sz // 2), GROUND_Y - self.sz - 1
+        return x0, y0, x0 + self.sz, y0 + self.sz
+
+def aabb(a, b):
+    """True if the half-open (x0, y0, x1, y1) boxes share any pixel."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
 
 # ───────────────────────────── Game Loop ───────────────────────────────
 def main():
@@ -177,25 +187,28 @@ def main():
         obstacles = [o for o in obstacles if o.x > -o.w]
         coins = [c for c in coins if c.x > -c.sz]
         # Collisions
+        runner_rect = runner.rect
         for o in obstacles:
-            if any((px,py) in runner.pixels() for px,py in o.pixels()):
+            if aabb(runner_rect, o.rect):
                 runner.reset(); obstacles.clear(); coins.clear(); break
-        for c in coins:
-            if any((px,py) in runner.pixels() for px,py in c.pixels()):
-                score += 1; coins.remove(c); break
+        for i, c in enumerate(coins):
+            if aabb(runner_rect, c.rect):
+                score += 1; del coins[i]; break
         # Draw
         dsp.clear()
         # ground
-        for x in range(W): dsp.set(x, GROUND_Y, COL_GROUND)
-        # runne r
-        for px,py in runner.pixels(): dsp.set(px, py, COL_RUNNER)
+        dsp.fb[GROUND_Y, :] = COL_GROUND
+        # runner
+        x0, y0, _, _ = runner.rect
+        dsp.fill_rect(x0, y0, runner.w, runner.h, COL_RUNNER)
         # obstacles
         for o in obstacles:
-            color = COL_OBSTACLE
-            for px,py in o.pixels(): dsp.set(px, py, color)
+            x0, y0, _, _ = o.rect
+            dsp.fill_rect(x0, y0, o.w, o.h, COL_OBSTACLE)
         # coins
         for c in coins:
-            for px,py in c.pixels(): dsp.set(px, py, COL_COIN)
+            x0, y0, _, _ = c.rect
+            dsp.fill_rect(x0, y0, c.sz, c.sz, COL_COIN)
         dsp.show()
         clock.tick(FPS)
     pygame.quit()